@@ -0,0 +1,79 @@
+"""
+Header Mapping for Multi-Cloud Events
+"""
+
+_MISSING = object()
+
+
+class HeaderDict(dict):
+    """
+    A dict of HTTP headers with case-insensitive lookup.
+
+    Construction, writes and comparisons are plain dict operations, so keys
+    keep the case they were set with and keys differing only in case stay
+    separate entries. lookup() probes the lowercased name first, which is a
+    single hash probe when keys are stored lowercase (as adapters do). Other
+    casings go through a lowercased index of the keys, built on the first
+    such lookup and dropped on every write. If several keys differ only in
+    case, the lowercase one wins, then the first in insertion order.
+    """
+    # No __init__: dict's own keeps construction at plain-dict speed, and an
+    # unset _index reads as "not built yet"
+    # pylint: disable=attribute-defined-outside-init
+    __slots__ = ('_index',)
+
+    def __setitem__(self, key, value):
+        self._index = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._index = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._index = None
+        return super().__ior__(other)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def lookup(self, name, default=None):
+        """
+        Get header value case-insensitively.
+        """
+        lowered = name.lower()
+        value = self.get(lowered, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        index = getattr(self, '_index', None)
+        if index is None:
+            # Reversed so the first of several differently-cased keys wins
+            index = self._index = {key.lower(): key for key in reversed(self)}
+        key = index.get(lowered)
+        if key is None:
+            return default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        self._index = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._index = None
+        return super().setdefault(key, default)
+
+    def pop(self, key, *default):
+        self._index = None
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self._index = None
+        return super().popitem()
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def copy(self):
+        return type(self)(self)
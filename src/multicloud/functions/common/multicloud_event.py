@@ -1,33 +1,253 @@
 """
 Core Event Classes for Multi-Cloud Functions
 """
-from urllib.parse import parse_qs
-from typing import Dict, Any, Optional, Union
+from urllib.parse import unquote_plus
+from typing import Any, Optional, Union
 from dataclasses import dataclass
+from enum import IntEnum
 import json
-import base64
-import xml.etree.ElementTree as ET
-from xml.etree.ElementTree import ParseError
+import binascii
+import os
 
+from multicloud.functions.common.headers import HeaderDict
 
-@dataclass
-class MultiCloudEvent:
+# orjson is opt-in (MULTICLOUD_JSON_PARSER=orjson) rather than picked up
+# whenever it is importable: it returns integers wider than 64 bits as floats,
+# so a transitive install must not change what get_json() returns
+if os.environ.get('MULTICLOUD_JSON_PARSER', '').lower() == 'orjson':
+    import orjson
+
+    def _json_loads(body):
+        """
+        Parse JSON with orjson, retrying with the stdlib parser on failure.
+
+        orjson rejects some input json.loads accepts (NaN/Infinity, a UTF-8
+        BOM, out-of-range floats), so only a body both parsers reject is
+        malformed. Integers wider than 64 bits still come back as floats.
+        """
+        try:
+            return orjson.loads(body)  # pylint: disable=no-member
+        except ValueError:
+            return json.loads(body)
+else:
+    _json_loads = json.loads
+
+# Sentinel for header probes, since a stored value may be anything
+_MISSING = object()
+
+# Media type prefixes recognized by the predicates. Prefixes rather than
+# exact types, so variants such as application/json-seq or text/json5 that
+# the original substring checks accepted still match
+_JSON_PREFIXES = ('application/json', 'text/json')
+_XML_PREFIXES = ('application/xml', 'text/xml')
+_FORM_PREFIXES = ('application/x-www-form-urlencoded',)
+_MULTIPART_PREFIXES = ('multipart/form-data',)
+
+
+class ContentKind(IntEnum):
+    """
+    Kind of request content, as reported by MultiCloudEvent.content_kind().
+    """
+    UNKNOWN = 0
+    JSON = 1
+    XML = 2
+    FORM = 3
+    MULTIPART = 4
+    BINARY = 5
+    TEXT = 6
+
+
+def _media_type_kind(media_type: str) -> ContentKind:
+    """
+    Classify a lowercased media type without parameters.
+
+    Besides the known prefixes, the RFC 6839 structured syntax suffixes
+    (+json, +xml) mark JSON and XML, as in application/problem+json.
+    """
+    if media_type.startswith(_JSON_PREFIXES) or media_type.endswith('+json'):
+        return ContentKind.JSON
+    if media_type.startswith(_XML_PREFIXES) or media_type.endswith('+xml'):
+        return ContentKind.XML
+    if media_type.startswith(_FORM_PREFIXES):
+        return ContentKind.FORM
+    if media_type.startswith(_MULTIPART_PREFIXES):
+        return ContentKind.MULTIPART
+    return ContentKind.UNKNOWN
+
+
+# Characters fed to the XML parser at a time, see _xml_events()
+_XML_FEED_SIZE = 64 * 1024
+
+
+def _parse_query(query_string: str) -> dict[str, str]:
+    """
+    Parse a query string into the first value of each parameter.
+
+    Matches parse_qs() for the values get_query_param() returns (blank values
+    are dropped, '+' means space) without building a list per parameter or
+    unquoting repeated values that would be discarded.
+    """
+    params = {}
+    for pair in query_string.split('&'):
+        name, _, value = pair.partition('=')
+        if not value:
+            continue
+        name = unquote_plus(name)
+        if name not in params:
+            params[name] = unquote_plus(value)
+    return params
+
+
+def _xml_events(parser, xml: str):
+    """
+    Feed an XML document to a pull parser in slices, yielding the parser's
+    events after each one.
+
+    Draining the events as they are produced lets the caller prune finished
+    elements before the rest of the document is parsed, so the full tree and
+    event queue never exist at once.
+    """
+    for start in range(0, len(xml), _XML_FEED_SIZE):
+        parser.feed(xml[start:start + _XML_FEED_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _xml_events_to_dict(events) -> dict[str, Any]:
+    """
+    Build the dictionary for an XML document from its start/end events.
+
+    Uses an explicit stack instead of recursing per element, so deep
+    documents don't hit the recursion limit.
+    """
+    # One (element, list of (tag, value) pairs) entry per open element, above
+    # a bottom entry that receives the root element
+    stack = [(None, [])]
+    for event, element in events:
+        if event == 'start':
+            stack.append((element, []))
+            continue
+
+        _, children = stack.pop()
+        text = element.text.strip() if element.text else ''
+
+        if text and not children:
+            # Leaf element with text collapses to its text
+            value = text
+        else:
+            value = {}
+
+            # Add attributes
+            if element.attrib:
+                value['@attributes'] = dict(element.attrib)
+
+            # Add text content
+            if text:
+                value['text'] = text
+
+            # Add children
+            for tag, child_data in children:
+                existing = value.get(tag)
+                if existing is None:
+                    value[tag] = child_data
+                elif isinstance(existing, list):
+                    existing.append(child_data)
+                else:
+                    # Multiple children with same tag -> make it a list
+                    value[tag] = [existing, child_data]
+
+        parent, siblings = stack[-1]
+        siblings.append((element.tag, value))
+        if parent is not None:
+            # Detach finished children from the tree the parser is building;
+            # their data now lives in `value`
+            del parent[:]
+
+    # The parser closed cleanly, so there was exactly one root element
+    return stack[0][1][0][1]
+
+
+class _EventCaches:  # pylint: disable=too-few-public-methods
+    """
+    Slot for MultiCloudEvent's parse caches, created on first use.
+
+    Kept out of the dataclass fields so fields(), asdict() and astuple() only
+    see the event data. Each cache is a tuple whose first item is the value it
+    was derived from, and is reused only while that same object is in place:
+
+    - 'query': (query_string, first value of each query parameter)
+    - 'content_type': (raw content-type, content kind of its media type)
+    - 'json': (body, parsed JSON or None if malformed)
+    - 'xml': (body, parsed XML or None if malformed)
+    - 'text': (body, encoding, decoded text or None if undecodable)
+    """
+    __slots__ = ('_caches',)
+
+    def _get_caches(self) -> dict:
+        """
+        Get the cache dict, creating it on first use.
+
+        Created here rather than in __post_init__ so subclasses that define
+        their own __post_init__ don't have to remember to call this one.
+        """
+        try:
+            return self._caches
+        except AttributeError:
+            # pylint: disable-next=attribute-defined-outside-init
+            caches = self._caches = {}
+            return caches
+
+
+@dataclass(slots=True, weakref_slot=True)
+class MultiCloudEvent(_EventCaches):
     """
     A normalized event structure for multi-cloud serverless functions.
     """
     method: str
     path: str
-    headers: Dict[str, str]
+    headers: dict[str, str]
     query_string: str = ""
     body: Optional[Union[bytes, str, dict, list]] = None
     source: str = "unknown"
 
+    def __repr__(self):
+        # Only the short identifying fields: rendering headers and a body of
+        # any size on every log line or assertion message isn't worth it
+        return (
+            f"MultiCloudEvent(method={self.method!r}, path={self.path!r}, "
+            f"source={self.source!r})"
+        )
+
+    def __eq__(self, other):
+        # Same fields as the generated __eq__, but compared one at a time with
+        # the short strings first, so most mismatches never reach the headers
+        # or body and no field tuples are built
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.method == other.method
+            and self.path == other.path
+            and self.source == other.source
+            and self.query_string == other.query_string
+            and self.headers == other.headers
+            and self.body == other.body
+        )
+
     def get_header(self, name: str, default: Optional[str] = None) -> Optional[str]:
         """
         Get header value case-insensitively.
         """
+        headers = self.headers
+        if isinstance(headers, HeaderDict):
+            return headers.lookup(name, default)
+
+        # Same order as HeaderDict.lookup(): a lowercase key, then a scan
         name_lower = name.lower()
-        for key, value in self.headers.items():
+        value = headers.get(name_lower, _MISSING)
+        if value is not _MISSING:
+            return value
+        for key, value in headers.items():
             if key.lower() == name_lower:
                 return value
         return default
@@ -36,38 +256,56 @@ class MultiCloudEvent:
         """
         Extract query parameter by name.
         """
-        params = parse_qs(self.query_string)
-        return params.get(name, [default])[0]
+        if not self.query_string:
+            return default
+
+        caches = self._get_caches()
+        cache = caches.get('query')
+        if cache is None or cache[0] is not self.query_string:
+            cache = (self.query_string, _parse_query(self.query_string))
+            caches['query'] = cache
+        return cache[1].get(name, default)
 
     def is_json(self) -> bool:
         """
         Check if request has JSON content type.
         """
-        content_type = self.get_header('content-type', '')
-        return ('application/json' in content_type.lower() or
-                'text/json' in content_type.lower())
+        return self._media_kind() is ContentKind.JSON
 
     def is_xml(self) -> bool:
         """
         Check if request has XML content type.
         """
-        content_type = self.get_header('content-type', '')
-        return ('application/xml' in content_type.lower() or
-                'text/xml' in content_type.lower())
+        return self._media_kind() is ContentKind.XML
 
     def is_form_data(self) -> bool:
         """
         Check if request is form data.
         """
-        content_type = self.get_header('content-type', '')
-        return 'application/x-www-form-urlencoded' in content_type.lower()
+        return self._media_kind() is ContentKind.FORM
 
     def is_multipart(self) -> bool:
         """
         Check if request is multipart form data.
         """
-        content_type = self.get_header('content-type', '')
-        return 'multipart/form-data' in content_type.lower()
+        return self._media_kind() is ContentKind.MULTIPART
+
+    def content_kind(self) -> ContentKind:
+        """
+        Classify the request content in one call.
+
+        Recognized media types win over the body type, so a JSON request is
+        JSON whether its body is a str, bytes or an already-parsed dict. Other
+        requests are BINARY for a bytes body and TEXT for a str body.
+        """
+        kind = self._media_kind()
+        if kind is not ContentKind.UNKNOWN:
+            return kind
+        if isinstance(self.body, bytes):
+            return ContentKind.BINARY
+        if isinstance(self.body, str):
+            return ContentKind.TEXT
+        return ContentKind.UNKNOWN
 
     def is_binary(self) -> bool:
         """
@@ -75,7 +313,7 @@ class MultiCloudEvent:
         """
         return isinstance(self.body, bytes)
 
-    def get_json(self) -> Optional[Dict[str, Any]]:
+    def get_json(self) -> Optional[dict[str, Any]]:
         """
         Get body as JSON dict, parsing if necessary.
         """
@@ -83,25 +321,33 @@ class MultiCloudEvent:
         if isinstance(self.body, dict):
             return self.body
 
-        # If it's a string and content-type indicates JSON, try to parse
-        if isinstance(self.body, str) and self.is_json():
-            try:
-                return json.loads(self.body)
-            except json.JSONDecodeError:
-                return None
+        # If it's text or raw bytes and content-type indicates JSON, try to
+        # parse; both parsers accept UTF-8 bytes without a separate decode
+        if isinstance(self.body, (str, bytes)) and self.is_json():
+            caches = self._get_caches()
+            cache = caches.get('json')
+            if cache is None or cache[0] is not self.body:
+                try:
+                    parsed = _json_loads(self.body)
+                except ValueError:
+                    parsed = None
+                cache = (self.body, parsed)
+                caches['json'] = cache
+            return cache[1]
 
         return None
 
-    def get_xml(self) -> Optional[Dict[str, Any]]:
+    def get_xml(self) -> Optional[dict[str, Any]]:
         """
         Get body as parsed XML dict.
         """
         if isinstance(self.body, str) and self.is_xml():
-            try:
-                root = ET.fromstring(self.body)
-                return self._xml_to_dict(root)
-            except ParseError:
-                return None
+            caches = self._get_caches()
+            cache = caches.get('xml')
+            if cache is None or cache[0] is not self.body:
+                cache = (self.body, self._xml_to_dict(self.body))
+                caches['xml'] = cache
+            return cache[1]
         return None
 
     def get_binary(self) -> Optional[bytes]:
@@ -119,10 +365,16 @@ class MultiCloudEvent:
         if isinstance(self.body, str):
             return self.body
         if isinstance(self.body, bytes):
-            try:
-                return self.body.decode(encoding)
-            except UnicodeDecodeError:
-                return None
+            caches = self._get_caches()
+            cache = caches.get('text')
+            if cache is None or cache[0] is not self.body or cache[1] != encoding:
+                try:
+                    text = self.body.decode(encoding)
+                except UnicodeDecodeError:
+                    text = None
+                cache = (self.body, encoding, text)
+                caches['text'] = cache
+            return cache[2]
         return None
 
     def get_base64(self) -> Optional[str]:
@@ -130,34 +382,36 @@ class MultiCloudEvent:
         Get binary body as base64 encoded string.
         """
         if isinstance(self.body, bytes):
-            return base64.b64encode(self.body).decode('ascii')
+            # b64encode() is a Python wrapper around this same call
+            return binascii.b2a_base64(self.body, newline=False).decode('ascii')
         return None
 
-    def _xml_to_dict(self, element) -> Dict[str, Any]:
+    def _media_kind(self) -> ContentKind:
         """
-        Convert XML element to dictionary.
+        Classify the media type of the content-type header, ignoring
+        parameters such as charset or boundary. Cached until the header changes.
         """
-        result = {}
+        raw = self.get_header('content-type', '') or ''
+        caches = self._get_caches()
+        cache = caches.get('content_type')
+        if cache is None or cache[0] is not raw:
+            cache = (raw, _media_type_kind(raw.partition(';')[0].strip().lower()))
+            caches['content_type'] = cache
+        return cache[1]
 
-        # Add attributes
-        if element.attrib:
-            result['@attributes'] = element.attrib
-
-        # Add text content
-        if element.text and element.text.strip():
-            if len(element) == 0:  # No children
-                return element.text.strip()
-            result['text'] = element.text.strip()
-
-        # Add children
-        for child in element:
-            child_data = self._xml_to_dict(child)
-            if child.tag in result:
-                # Multiple children with same tag -> make it a list
-                if not isinstance(result[child.tag], list):
-                    result[child.tag] = [result[child.tag]]
-                result[child.tag].append(child_data)
-            else:
-                result[child.tag] = child_data
+    def _xml_to_dict(self, xml: str) -> Optional[dict[str, Any]]:
+        """
+        Convert XML document to dictionary, or None if it is malformed.
+        """
+        # Deferred so functions that never parse XML don't pay for loading the
+        # parser on cold start. The trade-off: the first get_xml() call pays
+        # it instead of container init. Functions serving XML can import
+        # xml.etree.ElementTree at startup to move it back there.
+        # pylint: disable-next=import-outside-toplevel
+        from xml.etree.ElementTree import ParseError, XMLPullParser
 
-        return result
+        parser = XMLPullParser(events=('start', 'end'))
+        try:
+            return _xml_events_to_dict(_xml_events(parser, xml))
+        except ParseError:
+            return None
@@ -4,9 +4,38 @@ event format.
 """
 import asyncio
 import logging
+from typing import Optional
+
+from multicloud.functions.common.headers import HeaderDict
 from multicloud.functions.common.multicloud_event import MultiCloudEvent
 
 
+logger = logging.getLogger(__name__)
+
+# Source tag for every event this adapter builds
+_SOURCE = 'knative'
+
+# Defaults for scope keys a server may omit
+_DEFAULT_METHOD = 'GET'
+_DEFAULT_PATH = '/'
+
+# Text-based content types that should be decoded to strings: these media
+# type prefixes, plus the +json/+xml suffixes MultiCloudEvent treats as JSON
+# and XML (application/problem+json, application/atom+xml, ...)
+_TEXT_CONTENT_TYPES = (
+    'text/',
+    'application/json',
+    'application/xml',
+    'application/x-www-form-urlencoded',
+    'multipart/'
+)
+_TEXT_SUFFIXES = ('+json', '+xml')
+
+# Largest declared content-length we preallocate for up front, so a client
+# can't force a huge allocation before sending any body
+_MAX_PREALLOCATED_BODY = 16 * 1024 * 1024
+
+
 async def adapt_asgi_request(scope, receive) -> MultiCloudEvent:
     """ 
     Parse a Knative HTTP Request into a normalized MultiCloudEvent.
@@ -19,65 +48,56 @@ async def adapt_asgi_request(scope, receive) -> MultiCloudEvent:
         MultiCloudEvent: Normalized event object
     """
     try:
-        # Receive the request body
-        message = await receive()
-        body = b''
-
-        if message['type'] == 'http.request':
-            body = message.get('body', b'')
-
-            # Continue receiving if there's more body content
-            while message.get('more_body', False):
-                message = await receive()
-                body += message.get('body', b'')
-
-        # Convert headers from bytes to strings
-        headers = {}
-        for header_name, header_value in scope.get('headers', []):
-            headers[header_name.decode('utf-8')] = header_value.decode('utf-8')
+        # Convert headers from bytes to strings. Names are lowercased as bytes
+        # and are ASCII tokens, so latin-1 decodes them without validation;
+        # values stay strict UTF-8 so bad bytes surface as an encoding error.
+        # With lowercase keys, every HeaderDict.lookup() is a single probe.
+        headers = HeaderDict({
+            header_name.lower().decode('latin-1'): header_value.decode('utf-8')
+            for header_name, header_value in scope.get('headers', ())
+        })
+
+        # Skip receive() when the request can't carry a body
+        content_length = headers.get('content-length')
+        if content_length == '0' or scope.get('method') == 'HEAD':
+            body = b''
+        else:
+            body = await _receive_body(receive, content_length)
 
         # Simple body conversion: decode text-based content, keep binary as bytes
         parsed_body = _convert_body(body, headers.get('content-type', ''))
 
         return MultiCloudEvent(
-            method=scope.get('method', 'GET'),
-            path=scope.get('path', '/'),
+            method=scope.get('method', _DEFAULT_METHOD),
+            path=scope.get('path', _DEFAULT_PATH),
             headers=headers,
             query_string=scope.get('query_string', b'').decode(),
             body=parsed_body,
-            source='knative'
+            source=_SOURCE
         )
 
     except (ConnectionError, asyncio.TimeoutError) as e:
         # Network/connection issues with receive()
-        logging.error("Connection error while receiving ASGI request: %s", e)
-        return MultiCloudEvent(
-            method=scope.get('method', 'GET'),
-            path=scope.get('path', '/'),
-            headers={'x-error': f'Connection error: {str(e)}'},
-            query_string='',
-            source='knative'
-        )
-    except (UnicodeDecodeError, UnicodeError) as e:
+        logger.error("Connection error while receiving ASGI request: %s", e)
+        error = f'Connection error: {e}'
+    except UnicodeError as e:
         # Encoding issues with headers or query string
-        logging.error("Encoding error in ASGI request: %s", e)
-        return MultiCloudEvent(
-            method=scope.get('method', 'GET'),
-            path=scope.get('path', '/'),
-            headers={'x-error': f'Encoding error: {str(e)}'},
-            query_string='',
-            source='knative'
-        )
+        logger.error("Encoding error in ASGI request: %s", e)
+        error = f'Encoding error: {e}'
     except KeyError as e:
-        # Missing required keys in scope or message
-        logging.error("Missing required key in ASGI request: %s", e)
-        return MultiCloudEvent(
-            method='GET',
-            path='/',
-            headers={'x-error': f'Missing key: {str(e)}'},
-            query_string='',
-            source='knative'
-        )
+        # Missing required keys in scope or message; scope may be the
+        # broken part, so fall back to the defaults instead of reading it
+        logger.error("Missing required key in ASGI request: %s", e)
+        error = f'Missing key: {e}'
+        scope = {}
+
+    return MultiCloudEvent(
+        method=scope.get('method', _DEFAULT_METHOD),
+        path=scope.get('path', _DEFAULT_PATH),
+        headers={'x-error': error},
+        query_string='',
+        source=_SOURCE
+    )
 
 
 async def adapt_cloud_event_request(scope, receive) -> MultiCloudEvent:
@@ -96,6 +116,54 @@ async def adapt_cloud_event_request(scope, receive) -> MultiCloudEvent:
     return await adapt_asgi_request(scope, receive)
 
 
+async def _receive_body(receive, content_length: Optional[str] = None) -> bytes:
+    """
+    Read the full request body from the ASGI receive callable.
+
+    When the request declares a content-length, chunks are copied into a
+    buffer of that size instead of growing one chunk at a time.
+    """
+    message = await receive()
+    if message['type'] != 'http.request':
+        return b''
+
+    body = message.get('body', b'')
+    if not message.get('more_body', False):
+        # Single-chunk body (the common case): use it as-is, no copy
+        return body
+
+    # Fill a single buffer in place; repeated bytes concatenation copies
+    # the whole body on every chunk. Slice assignment past the end of the
+    # buffer grows it, so a missing or understated length is still correct.
+    buffer = bytearray(_preallocated_size(content_length))
+    offset = 0
+
+    # Continue receiving while there's more body content
+    while True:
+        end = offset + len(body)
+        buffer[offset:end] = body
+        offset = end
+        if not message.get('more_body', False):
+            break
+        message = await receive()
+        body = message.get('body', b'')
+
+    # Drop any unused space if the body was shorter than declared
+    del buffer[offset:]
+    return bytes(buffer)
+
+
+def _preallocated_size(content_length: Optional[str]) -> int:
+    """
+    Get the buffer size to preallocate for a declared content-length.
+    """
+    try:
+        size = int(content_length)
+    except (TypeError, ValueError):
+        return 0
+    return size if 0 < size <= _MAX_PREALLOCATED_BODY else 0
+
+
 def _convert_body(body: bytes, content_type: str):
     """
     Simple body conversion: decode text-based content types to string,
@@ -104,22 +172,12 @@ def _convert_body(body: bytes, content_type: str):
     if not body:
         return None
 
-    content_type = content_type.lower()
-
-    # Text-based content types that should be decoded to strings
-    text_types = [
-        'text/',
-        'application/json',
-        'application/xml',
-        'application/x-www-form-urlencoded',
-        'multipart/'
-    ]
-
-    if any(content_type.startswith(t) for t in text_types):
+    media_type = content_type.partition(';')[0].strip().lower()
+    if media_type.startswith(_TEXT_CONTENT_TYPES) or media_type.endswith(_TEXT_SUFFIXES):
         try:
             return body.decode('utf-8')
         except UnicodeDecodeError:
-            logging.warning("Failed to decode text content as UTF-8, keeping as bytes")
+            logger.warning("Failed to decode text content as UTF-8, keeping as bytes")
             return body
 
     # Keep binary content as bytes
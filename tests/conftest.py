@@ -1,4 +1,7 @@
 import pytest
+# Async tests share one event loop per module (see asyncio_default_test_loop_scope
+# in pyproject.toml); tests must not close or replace the running loop.
+
 # Import all fixtures so they're available to all tests
 
 from tests.fixtures.multicloud_event_fixtures import *
\ No newline at end of file
@@ -1,11 +1,99 @@
 """
 Test Fixtures for MultiCloudEvent Objects.
+
+Events that tests only read are session-scoped and shared. Fixtures that tests
+mutate (basic_post_event) stay function-scoped.
 """
 import pytest
 from multicloud.functions.common.multicloud_event import MultiCloudEvent
 
 
-@pytest.fixture
+# Binary payloads shared by the fixtures below
+_PNG_HEADER = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'
+    b'\x00\x00\x00\x01\x00\x00\x00\x01'
+    b'\x08\x02\x00\x00\x00\x90wS\xde'
+)
+_LARGE_BINARY_BODY = bytes(range(256)) * 4
+
+# Parameter values for the parametrized fixtures at the bottom of the module
+_XML_CT_PARAMS = (
+    "application/xml",
+    "application/xml; charset=utf-8",
+    "text/xml",
+    "Application/XML",
+    "TEXT/XML",
+    "application/atom+xml",
+    "application/soap+xml; charset=utf-8"
+)
+_NON_XML_CT_PARAMS = (
+    "application/json",
+    "text/plain",
+    "application/x-www-form-urlencoded",
+    "multipart/form-data",
+    ""
+)
+_JSON_CT_PARAMS = (
+    "application/json",
+    "application/json; charset=utf-8",
+    "Application/JSON",
+    "APPLICATION/JSON",
+    "text/json",
+    "application/problem+json",
+    "application/ld+json; charset=utf-8",
+    "application/json-patch+json",
+    "application/json-seq",
+    "text/json5",
+    "application/vnd.api+json"
+)
+_NON_JSON_CT_PARAMS = (
+    "text/plain",
+    "text/html",
+    "application/xml",
+    "application/x-www-form-urlencoded",
+    "multipart/form-data"
+)
+_FORM_CT_PARAMS = (
+    "application/x-www-form-urlencoded",
+    "application/x-www-form-urlencoded; charset=utf-8",
+    "Application/X-WWW-Form-Urlencoded",
+    "APPLICATION/X-WWW-FORM-URLENCODED"
+)
+_NON_FORM_CT_PARAMS = (
+    "application/json",
+    "text/plain",
+    "multipart/form-data",
+    "application/xml",
+    ""
+)
+_MULTIPART_CT_PARAMS = (
+    "multipart/form-data",
+    "multipart/form-data; boundary=----WebKitFormBoundary",
+    "Multipart/Form-Data",
+    "MULTIPART/FORM-DATA"
+)
+_NON_MULTIPART_CT_PARAMS = (
+    "application/json",
+    "application/x-www-form-urlencoded",
+    "text/plain",
+    "application/octet-stream",
+    ""
+)
+_NON_DICT_BODY_PARAMS = (
+    "string body",
+    123,
+    ["list", "body"],
+    None
+)
+_NON_TEXT_BODY_PARAMS = (
+    {"json": "body"},
+    ["list", "body"],
+    123,
+    None
+)
+
+
+@pytest.fixture(scope='session')
 def basic_get_event():
     """
     Basic GET Request with JSON content-Type.
@@ -21,6 +109,8 @@ def basic_get_event():
 def basic_post_event():
     """
     Basic POST Request with JSON content-Type.
+
+    Function-scoped: tests reassign its body and content-type header.
     """
     return MultiCloudEvent(
         method="POST",
@@ -29,7 +119,7 @@ def basic_post_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def simple_xml_event():
     """
     Event with simple XML body.
@@ -41,7 +131,7 @@ def simple_xml_event():
         body='<user><name>John Doe</name><age>30</age></user>'
     )
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def xml_with_attributes_event():
     """
     Event with XML containing attributes.
@@ -53,7 +143,7 @@ def xml_with_attributes_event():
         body='<user id="123" active="true"><name>Jane</name></user>'
     )
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def nested_xml_event():
     """
     Event with nested XML elements.
@@ -78,7 +168,7 @@ def nested_xml_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def duplicate_xml_tags_event():
     """Event with duplicate XML tags (creates lists)."""
     xml_body = '''
@@ -97,7 +187,7 @@ def duplicate_xml_tags_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def malformed_xml_event():
     """Event with malformed XML."""
     return MultiCloudEvent(
@@ -108,7 +198,7 @@ def malformed_xml_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def json_string_event():
     """Event with JSON as string body."""
     return MultiCloudEvent(
@@ -119,7 +209,7 @@ def json_string_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def malformed_json_event():
     """Event with malformed JSON string."""
     return MultiCloudEvent(
@@ -130,34 +220,29 @@ def malformed_json_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def png_binary_event():
     """Event with PNG binary data."""
-    png_data = (
-        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'
-        b'\x00\x00\x00\x01\x00\x00\x00\x01'
-        b'\x08\x02\x00\x00\x00\x90wS\xde'
-    )
     return MultiCloudEvent(
         method="POST",
         path="/upload",
         headers={"content-type": "image/png"},
-        body=png_data
+        body=_PNG_HEADER
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def large_binary_event():
     """Event with large binary data."""
     return MultiCloudEvent(
         method="POST",
         path="/upload-binary",
         headers={"content-type": "application/octet-stream"},
-        body=bytes(range(256)) * 4
+        body=_LARGE_BINARY_BODY
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def form_data_event():
     """Event with URL-encoded form data."""
     return MultiCloudEvent(
@@ -168,7 +253,7 @@ def form_data_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def empty_form_event():
     """Event with empty form data."""
     return MultiCloudEvent(
@@ -179,7 +264,7 @@ def empty_form_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def plain_text_event():
     """Event with plain text body."""
     return MultiCloudEvent(
@@ -190,7 +275,7 @@ def plain_text_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def utf8_text_event():
     """Event with UTF-8 encoded text."""
     return MultiCloudEvent(
@@ -201,7 +286,7 @@ def utf8_text_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def invalid_encoding_event():
     """Event with bytes that can't be decoded as UTF-8."""
     return MultiCloudEvent(
@@ -212,7 +297,7 @@ def invalid_encoding_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def no_content_type_event():
     """Event without content-type header."""
     return MultiCloudEvent(
@@ -222,7 +307,7 @@ def no_content_type_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def case_sensitive_headers_event():
     """Event with mixed-case headers for testing case sensitivity."""
     return MultiCloudEvent(
@@ -236,72 +321,78 @@ def case_sensitive_headers_event():
     )
 
 
+@pytest.fixture(scope='session')
+def make_event():
+    """
+    Factory for POST /api events with a given content-type and body.
+    """
+    def _make_event(content_type, body=None):
+        return MultiCloudEvent(
+            method="POST",
+            path="/api",
+            headers={"content-type": content_type},
+            body=body
+        )
+
+    return _make_event
+
+
 # Parametrized fixtures for content types
-@pytest.fixture(params=[
-    "application/xml",
-    "application/xml; charset=utf-8",
-    "text/xml",
-    "Application/XML",
-    "TEXT/XML"
-])
+@pytest.fixture(scope='session', params=_XML_CT_PARAMS)
 def xml_content_type(request):
     """Various XML content types."""
     return request.param
 
 
-@pytest.fixture(params=[
-    "application/json",
-    "text/plain",
-    "application/x-www-form-urlencoded",
-    "multipart/form-data",
-    ""
-])
+@pytest.fixture(scope='session', params=_NON_XML_CT_PARAMS)
 def non_xml_content_type(request):
     """Non-XML content types."""
     return request.param
 
 
-@pytest.fixture(params=[
-    "application/json",
-    "application/json; charset=utf-8",
-    "Application/JSON",
-    "APPLICATION/JSON",
-    "text/json"
-])
+@pytest.fixture(scope='session', params=_JSON_CT_PARAMS)
 def json_content_type(request):
     """Various JSON content types."""
     return request.param
 
 
-@pytest.fixture(params=[
-    "text/plain",
-    "text/html",
-    "application/xml",
-    "application/x-www-form-urlencoded",
-    "multipart/form-data"
-])
+@pytest.fixture(scope='session', params=_NON_JSON_CT_PARAMS)
 def non_json_content_type(request):
     """Non-JSON content types."""
     return request.param
 
 
-@pytest.fixture(params=[
-    "string body",
-    123,
-    ["list", "body"],
-    None
-])
+@pytest.fixture(scope='session', params=_FORM_CT_PARAMS)
+def form_content_type(request):
+    """Various form data content types."""
+    return request.param
+
+
+@pytest.fixture(scope='session', params=_NON_FORM_CT_PARAMS)
+def non_form_content_type(request):
+    """Non-form data content types."""
+    return request.param
+
+
+@pytest.fixture(scope='session', params=_MULTIPART_CT_PARAMS)
+def multipart_content_type(request):
+    """Various multipart content types."""
+    return request.param
+
+
+@pytest.fixture(scope='session', params=_NON_MULTIPART_CT_PARAMS)
+def non_multipart_content_type(request):
+    """Non-multipart content types."""
+    return request.param
+
+
+@pytest.fixture(scope='session', params=_NON_DICT_BODY_PARAMS)
 def non_dict_body(request):
     """Non-dictionary body types."""
     return request.param
 
 
-@pytest.fixture(params=[
-    {"json": "body"},
-    ["list", "body"],
-    123,
-    None
-])
+@pytest.fixture(scope='session', params=_NON_TEXT_BODY_PARAMS)
 def non_text_body(request):
     """Non-text body types."""
     return request.param
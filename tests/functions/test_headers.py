@@ -0,0 +1,143 @@
+"""
+Tests for HeaderDict
+"""
+import copy
+import pickle
+
+from multicloud.functions.common.headers import HeaderDict
+from multicloud.functions.common.multicloud_event import MultiCloudEvent
+
+
+class TestHeaderDict:
+    """
+    Tests for case-insensitive header mapping.
+    """
+    def test_behaves_like_dict(self):
+        """
+        Test that keys keep their case and compare like a plain dict.
+        """
+        headers = HeaderDict({"Content-Type": "application/json"})
+
+        assert headers == {"Content-Type": "application/json"}
+        assert headers["Content-Type"] == "application/json"
+        assert list(headers) == ["Content-Type"]
+
+    def test_lookup_case_insensitive(self):
+        """
+        Test lookup with different casings and defaults.
+        """
+        headers = HeaderDict({"X-Custom-Header": "custom-value"})
+
+        assert headers.lookup("x-custom-header") == "custom-value"
+        assert headers.lookup("X-CUSTOM-HEADER") == "custom-value"
+        assert headers.lookup("missing") is None
+        assert headers.lookup("missing", "none") == "none"
+
+    def test_keeps_differently_cased_keys(self):
+        """
+        Test that keys differing only in case stay separate, like a plain dict.
+        """
+        headers = HeaderDict({"X-A": "1", "x-a": "2"})
+
+        assert headers == {"X-A": "1", "x-a": "2"}
+        assert headers.lookup("X-A") == "2"
+
+        headers["content-type"] = "application/json"
+        headers["Content-Type"] = "text/xml"
+        assert headers["content-type"] == "application/json"
+        assert headers["Content-Type"] == "text/xml"
+
+    def test_lookup_precedence_matches_plain_dict_events(self):
+        """
+        Test that a lowercase key wins, then the first key in insertion order.
+        """
+        for items, expected in (
+            ({"X-A": "1", "x-a": "2"}, "2"),
+            ({"X-A": "1", "x-A": "2"}, "1"),
+        ):
+            assert HeaderDict(items).lookup("X-a") == expected
+            event = MultiCloudEvent(method="GET", path="/test", headers=items)
+            assert event.get_header("X-a") == expected
+
+    def test_writes_refresh_lookup_index(self):
+        """
+        Test that lookups see every kind of write made after the first lookup.
+        """
+        headers = HeaderDict(a="1", B="2", c="3")
+        assert headers.lookup("A") == "1"
+
+        headers["D"] = "4"
+        assert headers.lookup("d") == "4"
+
+        del headers["a"]
+        assert headers.pop("B") == "2"
+        assert headers.pop("missing", None) is None
+        headers.popitem()
+        headers.popitem()
+
+        assert not headers
+        assert headers.lookup("a") is None
+        assert headers.lookup("b") is None
+        assert headers.lookup("c") is None
+
+        headers.setdefault("Accept", "*/*")
+        assert headers.lookup("accept") == "*/*"
+        headers.update({"X-Id": "1"})
+        assert headers.lookup("x-id") == "1"
+        headers |= {"X-Id": "2"}
+        assert headers.lookup("x-id") == "2"
+
+        headers.clear()
+        assert headers.lookup("accept") is None
+
+    def test_copy_and_pickle(self):
+        """
+        Test that copies are independent HeaderDicts.
+        """
+        headers = HeaderDict({"Authorization": "Bearer token"})
+
+        for clone in (headers.copy(), copy.copy(headers), copy.deepcopy(headers),
+                      pickle.loads(pickle.dumps(headers))):
+            assert isinstance(clone, HeaderDict)
+            clone["Authorization"] = "changed"
+            assert clone.lookup("AUTHORIZATION") == "changed"
+            assert headers.lookup("AUTHORIZATION") == "Bearer token"
+
+    def test_event_keeps_headers_as_given(self):
+        """
+        Test that MultiCloudEvent stores the headers mapping it was given.
+        """
+        headers = {"Content-Type": "application/json"}
+        event = MultiCloudEvent(method="GET", path="/test", headers=headers)
+
+        assert event.headers is headers
+
+        headers["Content-Type"] = "text/xml"
+        assert event.get_header("content-type") == "text/xml"
+
+        event = MultiCloudEvent(method="GET", path="/test", headers=None)
+        assert event.headers is None
+
+    def test_event_with_header_dict(self):
+        """
+        Test get_header with HeaderDict headers, including later writes.
+        """
+        event = MultiCloudEvent(
+            method="GET",
+            path="/test",
+            headers=HeaderDict({"Content-Type": "application/json"})
+        )
+
+        assert event.get_header("content-type") == "application/json"
+
+        event.headers["Content-Type"] = "text/xml"
+        assert event.get_header("CONTENT-TYPE") == "text/xml"
+
+    def test_event_with_plain_dict_headers(self):
+        """
+        Test get_header still works when headers are replaced with a plain dict.
+        """
+        event = MultiCloudEvent(method="GET", path="/test", headers={})
+        event.headers = {"X-Request-Id": "abc"}
+
+        assert event.get_header("x-request-id") == "abc"
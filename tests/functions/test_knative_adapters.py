@@ -4,14 +4,45 @@ Tests for Knative ASGI request adapter
 
 import json
 import asyncio
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
 from multicloud.functions.knative.adapters import adapt_asgi_request
+from multicloud.functions.common.headers import HeaderDict
 from multicloud.functions.common.multicloud_event import MultiCloudEvent
 
 
+# Shared ASGI header tuples; tests append request-specific headers with +
+_JSON_HEADERS = ((b'content-type', b'application/json'),)
+_FORM_HEADERS = ((b'content-type', b'application/x-www-form-urlencoded'),)
+_TEXT_HEADERS = ((b'content-type', b'text/plain'),)
+_XML_HEADERS = ((b'content-type', b'application/xml'),)
+_BINARY_HEADERS = ((b'content-type', b'application/octet-stream'),)
+
+
+def make_receive(*messages):
+    """
+    Build an ASGI receive callable that returns the given messages in order.
+    """
+    remaining = iter(messages)
+
+    async def receive():
+        return next(remaining)
+
+    return receive
+
+
+def make_failing_receive(error):
+    """
+    Build an ASGI receive callable that raises the given exception.
+    """
+    async def receive():
+        raise error
+
+    return receive
+
+
 class TestAdaptAsgiRequest:
     """
     Tests for Knative ASGI request adapter.
@@ -31,7 +62,7 @@ class TestAdaptAsgiRequest:
             ]
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': b'',
             'more_body': False
@@ -43,6 +74,7 @@ class TestAdaptAsgiRequest:
         assert result.method == 'GET'
         assert result.path == '/api/users'
         assert result.query_string == 'page=1&limit=10'
+        assert isinstance(result.headers, HeaderDict)
         assert result.headers['accept'] == 'application/json'
         assert result.headers['user-agent'] == 'test-client/1.0'
         assert result.headers['host'] == 'localhost:8080'
@@ -66,14 +98,13 @@ class TestAdaptAsgiRequest:
             'method': 'POST',
             'path': '/api/users',
             'query_string': b'',
-            'headers': [
-                (b'content-type', b'application/json'),
-                (b'content-length', str(len(body_bytes)).encode()),
+            'headers': _JSON_HEADERS + (
+                (b'content-length', b'%d' % len(body_bytes)),
                 (b'authorization', b'Bearer token123'),
-            ]
+            )
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -92,6 +123,41 @@ class TestAdaptAsgiRequest:
         assert result.get_json() == test_data
         assert result.source == 'knative'
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('content_type', [
+        b'application/problem+json',
+        b'application/ld+json; charset=utf-8',
+        b'application/json-patch+json',
+        b'application/vnd.api+json',
+    ])
+    async def test_structured_json_body_is_text(self, content_type):
+        """Test that JSON-based media types are decoded like application/json."""
+        body_bytes = b'{"title": "Not Found", "status": 404}'
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/api/errors',
+            'query_string': b'',
+            'headers': (
+                (b'content-type', content_type),
+                (b'content-length', b'%d' % len(body_bytes)),
+            )
+        }
+
+        receive = make_receive({
+            'type': 'http.request',
+            'body': body_bytes,
+            'more_body': False
+        })
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.body == body_bytes.decode('utf-8')
+        assert result.is_json() is True
+        assert result.is_binary() is False
+        assert result.get_json() == {'title': 'Not Found', 'status': 404}
+
     @pytest.mark.asyncio
     async def test_url_encoded_form_data(self):
         """Test POST request with URL-encoded form data."""
@@ -103,13 +169,12 @@ class TestAdaptAsgiRequest:
             'method': 'POST',
             'path': '/api/contact',
             'query_string': b'',
-            'headers': [
-                (b'content-type', b'application/x-www-form-urlencoded'),
-                (b'content-length', str(len(body_bytes)).encode()),
-            ]
+            'headers': _FORM_HEADERS + (
+                (b'content-length', b'%d' % len(body_bytes)),
+            )
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -152,11 +217,11 @@ class TestAdaptAsgiRequest:
             'query_string': b'',
             'headers': [
                 (b'content-type', f'multipart/form-data; boundary={boundary}'.encode()),
-                (b'content-length', str(len(body_bytes)).encode()),
+                (b'content-length', b'%d' % len(body_bytes)),
             ]
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -188,12 +253,12 @@ class TestAdaptAsgiRequest:
             'query_string': b'filename=test.png',
             'headers': [
                 (b'content-type', b'image/png'),
-                (b'content-length', str(len(binary_data)).encode()),
+                (b'content-length', b'%d' % len(binary_data)),
                 (b'x-file-name', b'test.png'),
             ]
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': binary_data,
             'more_body': False
@@ -215,51 +280,6 @@ class TestAdaptAsgiRequest:
         assert len(result.get_binary()) == len(binary_data)
         assert result.source == 'knative'
 
-    @pytest.mark.asyncio
-    async def test_chunked_body_reception(self):
-        """Test receiving body in multiple chunks."""
-        json_data = {'message': 'This is a longer message that might be chunked'}
-        json_string = json.dumps(json_data)
-        full_body = json_string.encode('utf-8')
-        chunk_size = 20
-
-        scope = {
-            'type': 'http',
-            'method': 'POST',
-            'path': '/api/messages',
-            'query_string': b'',
-            'headers': [
-                (b'content-type', b'application/json'),
-                (b'transfer-encoding', b'chunked'),
-            ]
-        }
-
-        # Split the body into chunks
-        chunks = [full_body[i:i+chunk_size] for i in range(0, len(full_body), chunk_size)]
-
-        # Mock receiving in chunks
-        receive_calls = []
-        for i, chunk in enumerate(chunks):
-            is_last = i == len(chunks) - 1
-            receive_calls.append({
-                'type': 'http.request',
-                'body': chunk,
-                'more_body': not is_last
-            })
-
-        receive = AsyncMock(side_effect=receive_calls)
-
-        result = await adapt_asgi_request(scope, receive)
-
-        assert isinstance(result, MultiCloudEvent)
-        assert result.method == 'POST'
-        assert result.path == '/api/messages'
-        # Body should be the JSON string, get_json() parses it
-        assert result.body == json_string
-        assert result.is_json() is True
-        assert result.get_json() == json_data
-        assert result.source == 'knative'
-
     @pytest.mark.asyncio
     async def test_plain_text_body(self):
         """Test POST request with plain text body."""
@@ -271,13 +291,12 @@ class TestAdaptAsgiRequest:
             'method': 'PUT',
             'path': '/api/notes/123',
             'query_string': b'',
-            'headers': [
-                (b'content-type', b'text/plain'),
-                (b'content-length', str(len(body_bytes)).encode()),
-            ]
+            'headers': _TEXT_HEADERS + (
+                (b'content-length', b'%d' % len(body_bytes)),
+            )
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -306,12 +325,10 @@ class TestAdaptAsgiRequest:
             'method': 'POST',
             'path': '/api/data',
             'query_string': b'',
-            'headers': [
-                (b'content-type', b'application/json'),
-            ]
+            'headers': _JSON_HEADERS
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -333,7 +350,7 @@ class TestAdaptAsgiRequest:
         """Test adapter with minimal/missing scope data."""
         scope = {}  # Empty scope
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': b'',
             'more_body': False
@@ -365,7 +382,7 @@ class TestAdaptAsgiRequest:
             ]
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -391,12 +408,10 @@ class TestAdaptAsgiRequest:
             'method': 'POST',
             'path': '/api/xml',
             'query_string': b'',
-            'headers': [
-                (b'content-type', b'application/xml'),
-            ]
+            'headers': _XML_HEADERS
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': body_bytes,
             'more_body': False
@@ -418,6 +433,206 @@ class TestAdaptAsgiRequest:
         assert xml_data['age'] == '30'
         assert result.source == 'knative'
 
+    @pytest.mark.asyncio
+    async def test_header_names_lowercased(self):
+        """Test that header names are normalized to lowercase."""
+        scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': '/api',
+            'query_string': b'',
+            'headers': [
+                (b'Content-Type', b'application/json'),
+                (b'X-Request-ID', b'abc123'),
+            ]
+        }
+
+        receive = make_receive({
+            'type': 'http.request',
+            'body': b'',
+            'more_body': False
+        })
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.headers == {
+            'content-type': 'application/json',
+            'x-request-id': 'abc123'
+        }
+
+    @pytest.mark.asyncio
+    async def test_missing_scope_defaults(self):
+        """Test adapter behavior with missing scope keys (uses defaults)."""
+        # Minimal scope with missing optional keys
+        scope = {
+            'type': 'http'
+            # Missing method, path, query_string, headers
+        }
+
+        receive = make_receive({
+            'type': 'http.request',
+            'body': b'test',
+            'more_body': False
+        })
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert isinstance(result, MultiCloudEvent)
+        assert result.method == 'GET'  # Default
+        assert result.path == '/'  # Default
+        assert result.headers == {}  # Default (empty dict)
+        assert result.query_string == ''  # Default
+        assert result.body == b'test'  # Should still process body as binary (no content-type)
+        assert result.source == 'knative'
+
+
+class TestAdaptAsgiRequestBody:
+    """
+    Tests for how the adapter reads the request body from receive().
+    """
+    @pytest.mark.asyncio
+    async def test_chunked_body_reception(self):
+        """Test receiving body in multiple chunks."""
+        json_data = {'message': 'This is a longer message that might be chunked'}
+        json_string = json.dumps(json_data)
+        full_body = json_string.encode('utf-8')
+        chunk_size = 20
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/api/messages',
+            'query_string': b'',
+            'headers': _JSON_HEADERS + (
+                (b'transfer-encoding', b'chunked'),
+            )
+        }
+
+        # Split the body into chunks
+        chunks = [full_body[i:i+chunk_size] for i in range(0, len(full_body), chunk_size)]
+
+        # Mock receiving in chunks
+        receive_calls = []
+        for i, chunk in enumerate(chunks):
+            is_last = i == len(chunks) - 1
+            receive_calls.append({
+                'type': 'http.request',
+                'body': chunk,
+                'more_body': not is_last
+            })
+
+        receive = make_receive(*receive_calls)
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert isinstance(result, MultiCloudEvent)
+        assert result.method == 'POST'
+        assert result.path == '/api/messages'
+        # Body should be the JSON string, get_json() parses it
+        assert result.body == json_string
+        assert result.is_json() is True
+        assert result.get_json() == json_data
+        assert result.source == 'knative'
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_binary_body_not_copied(self):
+        """Test that a single-chunk binary body is passed through as-is."""
+        binary_data = b'\x00\x01\x02' * 100
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/api/files',
+            'query_string': b'',
+            'headers': _BINARY_HEADERS
+        }
+
+        receive = make_receive({
+            'type': 'http.request',
+            'body': binary_data,
+            'more_body': False
+        })
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.body is binary_data
+
+    @pytest.mark.asyncio
+    # Accurate, understated, overstated and malformed declared lengths
+    @pytest.mark.parametrize('declared', [b'50', b'20', b'80', b'not-a-number'])
+    async def test_chunked_body_with_content_length(self, declared):
+        """Test chunked reception when content-length is declared."""
+        full_body = b'0123456789' * 5
+        chunks = [full_body[i:i+16] for i in range(0, len(full_body), 16)]
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/api/files',
+            'query_string': b'',
+            'headers': _BINARY_HEADERS + (
+                (b'content-length', declared),
+            )
+        }
+
+        receive = make_receive(*(
+            {
+                'type': 'http.request',
+                'body': chunk,
+                'more_body': i < len(chunks) - 1
+            }
+            for i, chunk in enumerate(chunks)
+        ))
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.body == full_body
+
+    @pytest.mark.asyncio
+    async def test_zero_content_length_skips_receive(self):
+        """Test that an explicit empty body doesn't wait on receive()."""
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/api/ping',
+            'query_string': b'',
+            'headers': _JSON_HEADERS + (
+                (b'content-length', b'0'),
+            )
+        }
+
+        receive = make_failing_receive(AssertionError("receive() was called"))
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.method == 'POST'
+        assert result.body is None
+        assert result.source == 'knative'
+
+    @pytest.mark.asyncio
+    async def test_head_request_skips_receive(self):
+        """Test that a HEAD request doesn't wait on receive()."""
+        scope = {
+            'type': 'http',
+            'method': 'HEAD',
+            'path': '/api/ping',
+            'query_string': b'',
+            'headers': _JSON_HEADERS
+        }
+
+        receive = make_failing_receive(AssertionError("receive() was called"))
+
+        result = await adapt_asgi_request(scope, receive)
+
+        assert result.method == 'HEAD'
+        assert result.body is None
+        assert result.source == 'knative'
+
+
+class TestAdaptAsgiRequestErrors:
+    """
+    Tests for the error events the adapter returns instead of raising.
+    """
     @pytest.mark.asyncio
     async def test_connection_error_handling(self):
         """
@@ -427,11 +642,11 @@ class TestAdaptAsgiRequest:
             'type': 'http',
             'method': 'POST',
             'path': '/api/test',
-            'headers': [(b'content-type', b'application/json')]
+            'headers': _JSON_HEADERS
         }
 
-        # Mock receive to raise ConnectionError
-        receive = AsyncMock(side_effect=ConnectionError("Connection lost"))
+        # Receive raises ConnectionError
+        receive = make_failing_receive(ConnectionError("Connection lost"))
 
         result = await adapt_asgi_request(scope, receive)
 
@@ -453,8 +668,8 @@ class TestAdaptAsgiRequest:
             'headers': []
         }
 
-        # Mock receive to raise TimeoutError
-        receive = AsyncMock(side_effect=asyncio.TimeoutError("Request timeout"))
+        # Receive raises TimeoutError
+        receive = make_failing_receive(asyncio.TimeoutError("Request timeout"))
 
         result = await adapt_asgi_request(scope, receive)
 
@@ -474,13 +689,12 @@ class TestAdaptAsgiRequest:
             'type': 'http',
             'method': 'POST',
             'path': '/api/test',
-            'headers': [
-                (b'content-type', b'application/json'),
-                (b'invalid-header', b'\xff\xfe\x00\x00')  # Invalid UTF-8 bytes
-            ]
+            'headers': _JSON_HEADERS + (
+                (b'invalid-header', b'\xff\xfe\x00\x00'),  # Invalid UTF-8 bytes
+            )
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': b'{"test": "data"}',
             'more_body': False
@@ -506,7 +720,7 @@ class TestAdaptAsgiRequest:
             'headers': []
         }
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': b'',
             'more_body': False
@@ -528,7 +742,7 @@ class TestAdaptAsgiRequest:
         scope = Mock()
         scope.get = Mock(side_effect=KeyError("Required key missing"))
 
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.request',
             'body': b'',
             'more_body': False
@@ -554,7 +768,7 @@ class TestAdaptAsgiRequest:
         }
 
         # Return a different message type
-        receive = AsyncMock(return_value={
+        receive = make_receive({
             'type': 'http.disconnect',  # Not http.request
             'body': b'should not be processed'
         })
@@ -566,28 +780,3 @@ class TestAdaptAsgiRequest:
         assert result.path == '/api/test'
         assert result.body is None  # No body should be processed
         assert result.source == 'knative'
-
-    @pytest.mark.asyncio
-    async def test_missing_scope_defaults(self):
-        """Test adapter behavior with missing scope keys (uses defaults)."""
-        # Minimal scope with missing optional keys
-        scope = {
-            'type': 'http'
-            # Missing method, path, query_string, headers
-        }
-
-        receive = AsyncMock(return_value={
-            'type': 'http.request',
-            'body': b'test',
-            'more_body': False
-        })
-
-        result = await adapt_asgi_request(scope, receive)
-
-        assert isinstance(result, MultiCloudEvent)
-        assert result.method == 'GET'  # Default
-        assert result.path == '/'  # Default
-        assert result.headers == {}  # Default (empty dict)
-        assert result.query_string == ''  # Default
-        assert result.body == b'test'  # Should still process body as binary (no content-type)
-        assert result.source == 'knative'
@@ -2,7 +2,14 @@
 Tests for MultiCloudEvents
 """
 import base64
-from multicloud.functions.common.multicloud_event import MultiCloudEvent
+import math
+import os
+import weakref
+from dataclasses import asdict, dataclass, fields, replace
+
+import pytest
+
+from multicloud.functions.common.multicloud_event import ContentKind, MultiCloudEvent
 
 
 class TestMultiCloudEvent:
@@ -75,6 +82,76 @@ class TestMultiCloudEvent:
 
         assert event1 != event2
 
+    @pytest.mark.parametrize("name, value", [
+        ("method", "POST"),
+        ("path", "/other"),
+        ("headers", {"x-other": "1"}),
+        ("query_string", "other=1"),
+        ("body", b"other"),
+        ("source", "other"),
+    ])
+    def test_dataclass_equality_checks_every_field(self, basic_get_event, name, value):
+        """
+        Test that events differing in any one field are not equal.
+        """
+        assert replace(basic_get_event, **{name: value}) != basic_get_event
+
+    def test_dataclass_not_equal_to_other_types(self, basic_get_event):
+        """
+        Test that events don't equal other types and stay unhashable.
+        """
+        assert basic_get_event != object()
+        assert MultiCloudEvent.__hash__ is None
+
+    def test_event_uses_slots(self, basic_get_event):
+        """
+        Test that events don't carry a per-instance __dict__.
+        """
+        assert not hasattr(basic_get_event, "__dict__")
+
+    def test_event_supports_weakrefs(self, basic_get_event):
+        """
+        Test that slotted events can still be weakly referenced.
+        """
+        assert weakref.ref(basic_get_event)() is basic_get_event
+
+    def test_fields_exclude_parse_caches(self, json_string_event):
+        """
+        Test that parse caches don't show up as dataclass fields.
+        """
+        json_string_event.get_json()
+
+        names = ["method", "path", "headers", "query_string", "body", "source"]
+        assert [f.name for f in fields(json_string_event)] == names
+        assert list(asdict(json_string_event)) == names
+
+    def test_subclass_with_own_post_init(self):
+        """
+        Test that a subclass defining __post_init__ can still use the caches.
+        """
+        @dataclass(slots=True)
+        class TaggedEvent(MultiCloudEvent):
+            """Event subclass with an extra field and its own __post_init__."""
+            tag: str = ""
+
+            def __post_init__(self):
+                self.tag = self.tag.upper()
+
+        event = TaggedEvent(
+            method="POST",
+            path="/api",
+            headers={"content-type": "application/json"},
+            query_string="page=2",
+            body='{"a": 1}',
+            tag="x",
+        )
+
+        assert event.tag == "X"
+        assert event.is_json()
+        assert event.get_json() == {"a": 1}
+        assert event.get_query_param("page") == "2"
+        assert event.get_text() == '{"a": 1}'
+
     def test_repr_and_str(self, basic_get_event):
         """
         Test string representation of the event.
@@ -91,6 +168,14 @@ class TestMultiCloudEvent:
         assert "GET" in str_str
         assert "/test" in str_str
 
+    def test_repr_skips_body(self, large_binary_event):
+        """
+        Test that repr doesn't render the body.
+        """
+        assert repr(large_binary_event) == (
+            "MultiCloudEvent(method='POST', path='/upload-binary', source='unknown')"
+        )
+
 
 class TestMultiCloudHeaders:
     """
@@ -196,70 +281,89 @@ class TestMultiCloudQueryParams:
         assert event.get_query_param("anything") is None
         assert event.get_query_param("anything", "default") == "default"
 
+    def test_get_query_param_reparses_after_update(self):
+        """
+        Test get_query_param reflects a reassigned query string.
+        """
+        event = MultiCloudEvent(
+            method="GET",
+            path="/search",
+            headers={},
+            query_string="q=python"
+        )
+
+        assert event.get_query_param("q") == "python"
+
+        event.query_string = "q=rust"
+        assert event.get_query_param("q") == "rust"
+
+    def test_get_query_param_decoding(self):
+        """
+        Test percent-decoding, '+' as space and blank values match parse_qs.
+        """
+        event = MultiCloudEvent(
+            method="GET",
+            path="/search",
+            headers={},
+            query_string="q=hello+world&city=S%C3%A3o&empty=&flag&empty=later&a=b=c"
+        )
+
+        assert event.get_query_param("q") == "hello world"
+        assert event.get_query_param("city") == "São"
+        assert event.get_query_param("empty") == "later"
+        assert event.get_query_param("flag") is None
+        assert event.get_query_param("a") == "b=c"
+
 
 class TestMultiCloudJson:
     """
     Tests for JSON related functionality in MultiCloudEvent.
     """
-    def test_is_json_true_cases(self, json_content_type):
+    def test_is_json_true_cases(self, make_event, json_content_type):
         """
         Test is_json method returns True for JSON content types.
         """
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": json_content_type}
-        )
+        event = make_event(json_content_type)
         assert event.is_json(), f"Failed for content-type: {json_content_type}"
 
-    def test_is_json_false_cases(self, non_json_content_type):
+    def test_is_json_false_cases(self, make_event, non_json_content_type):
         """
         Test is_json method returns False for non-JSON content types.
         """
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": non_json_content_type}
-        )
+        event = make_event(non_json_content_type)
         assert not event.is_json(), f"Failed for content-type: {non_json_content_type}"
 
+    def test_is_json_ignores_content_type_parameters(self, make_event):
+        """
+        Test is_json only matches on the media type, not its parameters.
+        """
+        event = make_event("text/plain; profile=application/json")
+        assert not event.is_json()
+
     def test_is_json_no_content_type_header(self, no_content_type_event):
         """
         Test is_json method when no content-type header is present.
         """
         assert not no_content_type_event.is_json()
 
-    def test_get_json_with_dict_body(self):
+    def test_get_json_with_dict_body(self, make_event):
         """
         Test get_json method with dictionary body.
         """
         body_data = {"name": "John", "age": 30, "active": True}
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": "application/json"},
-            body=body_data
-        )
+        event = make_event("application/json", body=body_data)
 
         result = event.get_json()
         assert result == body_data
         assert isinstance(result, dict)
 
-    def test_get_json_with_non_dict_body(self, basic_post_event):
+    def test_get_json_with_non_dict_body(self, basic_post_event, non_dict_body):
         """
         Test get_json method with non-dictionary body.
         """
-        test_cases = [
-            "string body",
-            123,
-            ["list", "body"],
-            None
-        ]
+        basic_post_event.body = non_dict_body
 
-        for body in test_cases:
-            basic_post_event.body = body
-
-            assert basic_post_event.get_json() is None, f"Failed for body: {body}"
+        assert basic_post_event.get_json() is None, f"Failed for body: {non_dict_body}"
 
     def test_get_json_with_no_body(self):
         """
@@ -283,6 +387,54 @@ class TestMultiCloudJson:
         assert result == expected
         assert isinstance(result, dict)
 
+    def test_get_json_with_bytes_body(self, make_event):
+        """
+        Test get_json parses a raw UTF-8 bytes body.
+        """
+        event = make_event("application/json", body='{"name": "Zoë"}'.encode('utf-8'))
+
+        assert event.get_json() == {"name": "Zoë"}
+
+        event.body = b'{"name": '
+        assert event.get_json() is None
+
+    def test_get_json_accepts_stdlib_json_extensions(self, make_event):
+        """
+        Test get_json accepts what json.loads does, with or without orjson.
+        """
+        event = make_event("application/json", body=b'{"ratio": NaN, "max": Infinity}')
+        result = event.get_json()
+        assert math.isnan(result["ratio"])
+        assert result["max"] == math.inf
+
+        event.body = '\ufeff{"name": "John"}'.encode('utf-8')
+        assert event.get_json() == {"name": "John"}
+
+    @pytest.mark.skipif(
+        os.environ.get("MULTICLOUD_JSON_PARSER", "").lower() == "orjson",
+        reason="the orjson opt-in returns integers wider than 64 bits as floats",
+    )
+    def test_get_json_keeps_big_integers(self, make_event):
+        """
+        Test that integers wider than 64 bits stay exact by default.
+        """
+        event = make_event("application/json", body=b'{"id": 12345678901234567890123}')
+
+        assert event.get_json() == {"id": 12345678901234567890123}
+        assert isinstance(event.get_json()["id"], int)
+
+    def test_get_json_parses_once(self, make_event):
+        """
+        Test get_json reuses the parsed body until the body changes.
+        """
+        event = make_event("application/json", body='{"name": "John"}')
+
+        first = event.get_json()
+        assert event.get_json() is first
+
+        event.body = '{"name": "Jane"}'
+        assert event.get_json() == {"name": "Jane"}
+
     def test_get_json_with_malformed_json(self, malformed_json_event):
         """
         Test get_json method with malformed JSON string.
@@ -352,26 +504,32 @@ class TestMultiCloudBinary:
         assert invalid_encoding_event.get_text() is None
         assert invalid_encoding_event.get_text("utf-8") is None
 
-    def test_get_text_with_non_text_body(self):
+    def test_get_text_decodes_once(self, make_event):
         """
-        Test get_text method with non-text body.
+        Test get_text reuses the decoded body until the body or encoding changes.
         """
-        test_cases = [
-            {"json": "body"},
-            ["list", "body"],
-            123,
-            None
-        ]
+        event = make_event("text/plain", body="café".encode("utf-8"))
+
+        first = event.get_text()
+        assert event.get_text() is first
+        assert event.get_text("latin-1") == "cafÃ©"
+
+        event.body = b"\xff"
+        assert event.get_text() is None
+        assert event.get_text("latin-1") == "ÿ"
 
-        for body in test_cases:
-            event = MultiCloudEvent(
-                method="POST",
-                path="/api",
-                headers={},
-                body=body
-            )
+    def test_get_text_with_non_text_body(self, non_text_body):
+        """
+        Test get_text method with non-text body.
+        """
+        event = MultiCloudEvent(
+            method="POST",
+            path="/api",
+            headers={},
+            body=non_text_body
+        )
 
-            assert event.get_text() is None, f"Failed for body: {body}"
+        assert event.get_text() is None, f"Failed for body: {non_text_body}"
 
     def test_binary_file_upload(self, png_binary_event):
         """
@@ -397,67 +555,33 @@ class TestMultiCloudFormData:
     """
     Tests for Form Data related functionality in MultiCloudEvent.
     """
-    def test_is_form_data_true_cases(self, basic_post_event):
+    def test_is_form_data_true_cases(self, make_event, form_content_type):
         """
         Test is_form_data method returns True for form data content types.
         """
-        test_cases = [
-            "application/x-www-form-urlencoded",
-            "application/x-www-form-urlencoded; charset=utf-8",
-            "Application/X-WWW-Form-Urlencoded",
-            "APPLICATION/X-WWW-FORM-URLENCODED"
-        ]
+        event = make_event(form_content_type)
+        assert event.is_form_data(), f"Failed for content-type: {form_content_type}"
 
-        for content_type in test_cases:
-            basic_post_event.headers['content-type'] = content_type
-            assert basic_post_event.is_form_data(), f"Failed for content-type: {content_type}"
-
-    def test_is_form_data_false_cases(self, basic_post_event):
+    def test_is_form_data_false_cases(self, make_event, non_form_content_type):
         """
         Test is_form_data method returns False for non-form data content types.
         """
-        test_cases = [
-            "application/json",
-            "text/plain",
-            "multipart/form-data",
-            "application/xml",
-            ""
-        ]
-
-        for content_type in test_cases:
-            basic_post_event.headers['content-type'] = content_type
-            assert not basic_post_event.is_form_data(), f"Failed for content-type: {content_type}"
+        event = make_event(non_form_content_type)
+        assert not event.is_form_data(), f"Failed for content-type: {non_form_content_type}"
 
-    def test_is_multipart_true_cases(self, basic_post_event):
+    def test_is_multipart_true_cases(self, make_event, multipart_content_type):
         """
         Test is_multipart method returns True for multipart content types.
         """
-        test_cases = [
-            "multipart/form-data",
-            "multipart/form-data; boundary=----WebKitFormBoundary",
-            "Multipart/Form-Data",
-            "MULTIPART/FORM-DATA"
-        ]
+        event = make_event(multipart_content_type)
+        assert event.is_multipart(), f"Failed for content-type: {multipart_content_type}"
 
-        for content_type in test_cases:
-            basic_post_event.headers['content-type'] = content_type
-            assert basic_post_event.is_multipart(), f"Failed for content-type: {content_type}"
-
-    def test_is_multipart_false_cases(self, basic_post_event):
+    def test_is_multipart_false_cases(self, make_event, non_multipart_content_type):
         """
         Test is_multipart method returns False for non-multipart content types.
         """
-        test_cases = [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "text/plain",
-            "application/octet-stream",
-            ""
-        ]
-
-        for content_type in test_cases:
-            basic_post_event.headers['content-type'] = content_type
-            assert not basic_post_event.is_multipart(), f"Failed for content-type: {content_type}"
+        event = make_event(non_multipart_content_type)
+        assert not event.is_multipart(), f"Failed for content-type: {non_multipart_content_type}"
 
     def test_form_data_body_handling(self, form_data_event):
         """
@@ -507,17 +631,12 @@ class TestMultiCloudFormData:
         assert empty_form_event.get_text() == ""
         assert not empty_form_event.is_binary()
 
-    def test_mixed_content_type_detection(self):
+    def test_mixed_content_type_detection(self, make_event):
         """
         Test content type detection with various body types.
         """
         # JSON with correct content-type
-        json_event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": "application/json"},
-            body={"key": "value"}
-        )
+        json_event = make_event("application/json", body={"key": "value"})
         assert json_event.is_json()
         assert not json_event.is_form_data()
         assert not json_event.is_multipart()
@@ -547,49 +666,48 @@ class TestMultiCloudFormData:
         assert not binary_event.is_form_data()
         assert not binary_event.is_multipart()
 
+    @pytest.mark.parametrize("content_type, body, expected", [
+        ("application/json", {"key": "value"}, ContentKind.JSON),
+        ("application/json; charset=utf-8", b'{"key": "value"}', ContentKind.JSON),
+        ("text/xml", "<a>1</a>", ContentKind.XML),
+        ("application/x-www-form-urlencoded", "key=value", ContentKind.FORM),
+        ("multipart/form-data; boundary=x", b"--x--", ContentKind.MULTIPART),
+        ("application/pdf", b"%PDF-1.4", ContentKind.BINARY),
+        ("text/plain", "Hello", ContentKind.TEXT),
+        ("text/plain", None, ContentKind.UNKNOWN),
+    ])
+    def test_content_kind(self, make_event, content_type, body, expected):
+        """
+        Test content_kind classifies by media type, then by body type.
+        """
+        event = make_event(content_type, body=body)
+        assert event.content_kind() is expected
+
+    def test_content_kind_without_content_type(self):
+        """
+        Test content_kind falls back to the body type with no content-type.
+        """
+        event = MultiCloudEvent(method="POST", path="/api", headers={}, body=b"raw")
+        assert event.content_kind() is ContentKind.BINARY
+
+
 class TestMultiCloudXml:
     """
     Tests for XML related functionality in MultiCloudEvent.
     """
-    def test_is_xml_true_cases(self):
+    def test_is_xml_true_cases(self, make_event, xml_content_type):
         """
         Test is_xml method returns True for XML content types.
         """
-        test_cases = [
-            "application/xml",
-            "application/xml; charset=utf-8",
-            "text/xml",
-            "Application/XML",
-            "TEXT/XML"
-        ]
+        event = make_event(xml_content_type)
+        assert event.is_xml(), f"Failed for content-type: {xml_content_type}"
 
-        for content_type in test_cases:
-            event = MultiCloudEvent(
-                method="POST",
-                path="/api",
-                headers={"content-type": content_type}
-            )
-            assert event.is_xml(), f"Failed for content-type: {content_type}"
-
-    def test_is_xml_false_cases(self):
+    def test_is_xml_false_cases(self, make_event, non_xml_content_type):
         """
         Test is_xml method returns False for non-XML content types.
         """
-        test_cases = [
-            "application/json",
-            "text/plain",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-            ""
-        ]
-
-        for content_type in test_cases:
-            event = MultiCloudEvent(
-                method="POST",
-                path="/api",
-                headers={"content-type": content_type}
-            )
-            assert not event.is_xml(), f"Failed for content-type: {content_type}"
+        event = make_event(non_xml_content_type)
+        assert not event.is_xml(), f"Failed for content-type: {non_xml_content_type}"
 
     def test_get_xml_simple(self):
         """
@@ -696,6 +814,47 @@ class TestMultiCloudXml:
 
         assert result == expected
 
+    def test_get_xml_deeply_nested(self):
+        """
+        Test get_xml handles nesting deeper than the recursion limit.
+        """
+        depth = 2000
+        xml_string = '<a>' * depth + 'leaf' + '</a>' * depth
+
+        event = MultiCloudEvent(
+            method="POST",
+            path="/api/data",
+            headers={"content-type": "application/xml"},
+            body=xml_string
+        )
+
+        result = event.get_xml()
+        for _ in range(depth - 2):
+            result = result['a']
+
+        assert result == {'a': 'leaf'}
+
+    def test_get_xml_parses_once(self, simple_xml_event):
+        """
+        Test get_xml reuses the parsed body until the body changes.
+        """
+        event = MultiCloudEvent(
+            method="POST",
+            path="/api/users",
+            headers={"content-type": "application/xml"},
+            body=simple_xml_event.body
+        )
+
+        first = event.get_xml()
+        assert event.get_xml() is first
+
+        event.body = '<user><name>Jane</name></user>'
+        assert event.get_xml() == {'name': 'Jane'}
+
+        event.body = '<user><unclosed>'
+        assert event.get_xml() is None
+        assert event.get_xml() is None
+
     def test_get_xml_malformed(self):
         """
         Test get_xml method with malformed XML.
@@ -757,42 +916,27 @@ class TestMultiCloudXml:
         assert decoded == binary_data
         assert isinstance(result, str)
 
-    def test_get_base64_with_non_binary_body(self):
+    def test_get_base64_with_non_binary_body(self, make_event):
         """
         Test get_base64 returns None for non-binary body.
         """
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": "text/plain"},
-            body="text content"
-        )
+        event = make_event("text/plain", body="text content")
 
         assert event.get_base64() is None
 
-    def test_enhanced_get_text_with_dict_body(self):
+    def test_enhanced_get_text_with_dict_body(self, make_event):
         """
         Test get_text returns None for dict body.
         """
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": "application/json"},
-            body={"name": "test"}
-        )
+        event = make_event("application/json", body={"name": "test"})
 
         assert event.get_text() is None
 
-    def test_enhanced_get_text_with_list_body(self):
+    def test_enhanced_get_text_with_list_body(self, make_event):
         """
         Test get_text returns None for list body.
         """
-        event = MultiCloudEvent(
-            method="POST",
-            path="/api",
-            headers={"content-type": "application/json"},
-            body=["item1", "item2"]
-        )
+        event = make_event("application/json", body=["item1", "item2"])
 
         assert event.get_text() is None
 